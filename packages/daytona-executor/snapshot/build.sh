@@ -87,8 +87,8 @@ cp "$SCRIPT_DIR/Dockerfile" "$BUILD_CONTEXT/"
 
 echo -e "${YELLOW}Building Docker image...${NC}"
 
-# Build the image
-docker build \
+# Build the image (BuildKit is required for the Playwright cache mount)
+DOCKER_BUILDKIT=1 docker build \
     -t harvest-daytona-snapshot:latest \
     -f "$BUILD_CONTEXT/Dockerfile" \
     "$BUILD_CONTEXT"
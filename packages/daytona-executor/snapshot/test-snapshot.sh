@@ -18,6 +18,11 @@ echo -e "${YELLOW}Testing Harvest Daytona Snapshot Image${NC}"
 echo "Image: $IMAGE"
 echo ""
 
+# Start one long-lived container and exec every check inside it, instead of
+# paying container create/teardown per check
+CONTAINER=$(docker run -d --rm "$IMAGE" sleep infinity)
+trap 'docker rm -f "$CONTAINER" > /dev/null 2>&1' EXIT
+
 # Helper function to run test in container
 run_test() {
     local name="$1"
@@ -26,7 +31,7 @@ run_test() {
 
     echo -n "Testing: $name... "
 
-    result=$(docker run --rm "$IMAGE" bash -c "$cmd" 2>&1) || true
+    result=$(docker exec "$CONTAINER" bash -c "$cmd" 2>&1) || true
 
     if echo "$result" | grep -q "$expected"; then
         echo -e "${GREEN}PASS${NC}"
@@ -46,7 +51,7 @@ check_file() {
 
     echo -n "Checking: $name... "
 
-    if docker run --rm "$IMAGE" test -f "$path"; then
+    if docker exec "$CONTAINER" test -f "$path"; then
         echo -e "${GREEN}EXISTS${NC}"
         ((PASS++))
     else
@@ -62,7 +67,7 @@ check_dir() {
 
     echo -n "Checking: $name... "
 
-    if docker run --rm "$IMAGE" test -d "$path"; then
+    if docker exec "$CONTAINER" test -d "$path"; then
         echo -e "${GREEN}EXISTS${NC}"
         ((PASS++))
     else
@@ -102,13 +107,16 @@ run_test "Playwright MCP" "npm list -g @playwright/mcp" "playwright"
 echo ""
 echo "=== Playwright & Browser ==="
 run_test "Playwright installed" "npx playwright --version" ""
-run_test "Chromium available" "ls /home/harvest/.cache/ms-playwright/chromium-*/chrome-linux/chrome 2>/dev/null || echo 'chromium'" "chrom"
+run_test "Chromium available" 'cd "$(npm root -g)/@playwright/mcp" && test -x "$(node -p "require(\"playwright-core\").chromium.executablePath()")" && echo OK' "OK"
+run_test "Browser dir owned by harvest" "stat -c %U /ms-playwright" "harvest"
 
 echo ""
 echo "=== Configuration Files ==="
 check_file "claude.md" "/app/claude.md"
 check_file "autonomous-agent.md" "/app/autonomous-agent.md"
 check_file "memory-seed.json" "/app/memory-seed.json"
+check_file "memory-seed.jsonl" "/app/memory-seed.jsonl"
+check_file "memory store (pre-seeded)" "/home/harvest/.mcp-memory/memory.jsonl"
 check_dir "docs/ai/shared/" "/app/docs/ai/shared"
 check_dir "docs/mcp/" "/app/docs/mcp"
 
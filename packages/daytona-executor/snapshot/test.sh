@@ -180,30 +180,31 @@ echo ""
 
 if [ -n "$PROMPT_ARG" ]; then
     # Single prompt mode - no TTY needed
+    # The test code and prompt are passed as env vars rather than spliced into
+    # the script, so their contents never go through shell parsing
     docker run --rm \
         -e CLAUDE_CODE_OAUTH_TOKEN="$CLAUDE_CODE_OAUTH_TOKEN" \
+        -e HARVEST_TEST_CODE="$TEST_CODE" \
+        -e HARVEST_PROMPT="$PROMPT_ARG" \
         "$IMAGE" \
         bash -c "
             cd /tmp && \
             npm init -y > /dev/null 2>&1 && \
-            npm install @anthropic-ai/claude-agent-sdk > /dev/null 2>&1 && \
-            cat > test.ts << 'ENDOFCODE'
-$TEST_CODE
-ENDOFCODE
-            npx tsx test.ts '$PROMPT_ARG'
+            npm install --no-audit --no-fund @anthropic-ai/claude-agent-sdk > /dev/null 2>&1 && \
+            printf '%s' \"\$HARVEST_TEST_CODE\" > test.ts && \
+            exec npx tsx test.ts \"\$HARVEST_PROMPT\"
         "
 else
     # Interactive mode - needs TTY
     docker run -it --rm \
         -e CLAUDE_CODE_OAUTH_TOKEN="$CLAUDE_CODE_OAUTH_TOKEN" \
+        -e HARVEST_TEST_CODE="$TEST_CODE" \
         "$IMAGE" \
         bash -c "
             cd /tmp && \
             npm init -y > /dev/null 2>&1 && \
-            npm install @anthropic-ai/claude-agent-sdk > /dev/null 2>&1 && \
-            cat > test.ts << 'ENDOFCODE'
-$TEST_CODE
-ENDOFCODE
-            npx tsx test.ts
+            npm install --no-audit --no-fund @anthropic-ai/claude-agent-sdk > /dev/null 2>&1 && \
+            printf '%s' \"\$HARVEST_TEST_CODE\" > test.ts && \
+            exec npx tsx test.ts
         "
 fi
@@ -96,7 +96,7 @@ async function runPOC() {
     console.log("2. Installing @anthropic-ai/claude-agent-sdk...");
     console.log("   (This may take a while - package is ~70MB)");
     const installResult = await sandbox.process.executeCommand(
-      "npm init -y && npm install @anthropic-ai/claude-agent-sdk",
+      "npm init -y && npm install --no-audit --no-fund @anthropic-ai/claude-agent-sdk",
       undefined,
       undefined,
       180000 // 3 min timeout
@@ -134,6 +134,13 @@ async function runPOC() {
       if (line === "---SUMMARY---") continue;
       if (line === "---ERROR---") continue;
 
+      // SDK messages are always JSON objects; skip other lines without
+      // paying for a JSON.parse that throws
+      if (!line.startsWith("{")) {
+        console.log(`   Non-JSON line: ${line.substring(0, 50)}...`);
+        continue;
+      }
+
       try {
         const parsed = JSON.parse(line);
         if (parsed.success !== undefined) {
@@ -144,8 +151,8 @@ async function runPOC() {
           messages.push(parsed);
         }
       } catch {
-        // Not JSON, skip
-        console.log(`   Non-JSON line: ${line.substring(0, 50)}...`);
+        // Looked like a JSON object but failed to parse, skip
+        console.log(`   Unparseable JSON line: ${line.substring(0, 50)}...`);
       }
     }
 